@@ -23,6 +23,11 @@ import { OdooAiAgent as CoreOdooAiAgent } from '../../src/services/OdooAiAgent.j
 
 // No wrapper needed - use core class directly
 
+// Resolved Odoo configs per organization, reused across warm invocations
+// so repeated checks don't re-query organization_integrations every time
+const odooConfigCache = new Map();
+const ODOO_CONFIG_CACHE_TTL_MS = 60 * 1000;
+
 export const handler = async (event, context) => {
   const headers = {
     'Content-Type': 'application/json',
@@ -63,7 +68,11 @@ export const handler = async (event, context) => {
 
     // Get organization integrations
     let odooConfig = null;
-    if (organizationId) {
+    const cachedConfig = organizationId && odooConfigCache.get(organizationId);
+    if (cachedConfig && Date.now() - cachedConfig.cachedAt < ODOO_CONFIG_CACHE_TTL_MS) {
+      odooConfig = cachedConfig.config;
+      console.log('🔧 Using cached Odoo config for organization:', organizationId);
+    } else if (organizationId) {
       try {
         console.log('🔍 About to query Supabase with:');
         console.log('   organization_id:', organizationId);
@@ -128,6 +137,7 @@ export const handler = async (event, context) => {
             hasApiKey: !!odooConfig.apiKey,
             username: odooConfig.username
           });
+          odooConfigCache.set(organizationId, { config: odooConfig, cachedAt: Date.now() });
         } else {
           console.warn('⚠️  No integration found for organization ID:', organizationId);
           console.warn('🔍 Expected organization ID:', '9a4880df-ba32-4291-bd72-2b13dad95f20');
@@ -142,12 +152,17 @@ export const handler = async (event, context) => {
     const initialized = await agent.initialize(odooConfig);
 
     if (!initialized) {
+      // Incomplete Odoo config is a client-side setup problem: report which fields are missing
+      const initError = agent.initializationError;
       return {
-        statusCode: 500,
+        statusCode: initError?.missingFields ? 400 : 500,
         headers,
         body: JSON.stringify({
           success: false,
-          error: 'Failed to initialize Odoo AI Agent'
+          error: initError
+            ? `Failed to initialize Odoo AI Agent: ${initError.message}`
+            : 'Failed to initialize Odoo AI Agent',
+          missingFields: initError?.missingFields
         })
       };
     }
@@ -159,9 +174,10 @@ export const handler = async (event, context) => {
     // Uses resultData prepared by OdooAiAgent (works for both local and Netlify)
     if (checkId && result.success) {
       try {
+        const savedAt = new Date().toISOString();
         const resultData = {
           check_id: checkId,
-          executed_at: new Date().toISOString(),
+          executed_at: savedAt,
           status: result.status || 'unknown',
           duration: result.duration || 0,
           success: result.success,
@@ -185,10 +201,11 @@ export const handler = async (event, context) => {
         } else {
           console.log('✅ Check results saved to database');
           
-          // Also update root check status
+          // Also update root check status (only once its result row exists, so the
+          // status never points at a run missing from the history)
           const { error: updateCheckError } = await supabase
             .from('checks')
-            .update({ status: result.status || 'unknown', updated_at: new Date().toISOString() })
+            .update({ status: result.status || 'unknown', updated_at: savedAt })
             .eq('id', checkId);
           
           if (updateCheckError) {
@@ -35,12 +35,15 @@ export const handler = async (event, context) => {
       };
     }
 
+    // Format the timestamp once; every mock record shares it
+    const now = new Date().toISOString();
+
     // Mock search results for now
     const mockRecords = Array.from({ length: Math.min(limit, 5) }, (_, i) => ({
       id: i + 1,
       name: `Mock ${model} Record ${i + 1}`,
-      create_date: new Date().toISOString(),
-      write_date: new Date().toISOString()
+      create_date: now,
+      write_date: now
     }));
 
     return {
@@ -50,7 +53,7 @@ export const handler = async (event, context) => {
         success: true,
         records: mockRecords,
         count: mockRecords.length,
-        timestamp: new Date().toISOString()
+        timestamp: now
       })
     };
   } catch (error) {
@@ -216,7 +216,7 @@ const CheckResult = ({
       await updateStep(checkId, 'connect', 'running');
 
       // Step 2: Connect to Odoo
-      await new Promise(resolve => setTimeout(resolve, 500)); // Brief delay for UX
+      // No separate pre-flight: the check request below authenticates against Odoo itself
       await updateStep(checkId, 'connect', 'completed');
       await updateStep(checkId, 'query', 'running');
 
@@ -363,23 +363,28 @@ const CheckResult = ({
       // The LLM analyzes acceptance criteria and determines if it's met
       const checkStatus = data.status || 'unknown'; // Use LLM status, fallback to 'unknown'
       console.log('🎯 Frontend: Using LLM-determined status:', checkStatus, 'from data.status:', data.status, 'recordEvaluations:', data.recordEvaluations?.length || 0);
-      try {
-        const { createClient } = await import('@supabase/supabase-js');
-        const supabase = createClient(
-          import.meta.env.VITE_SUPABASE_URL,
-          import.meta.env.VITE_SUPABASE_ANON_KEY
-        );
-        const { error: updateError } = await supabase
-          .from('checks')
-          .update({ status: checkStatus, updated_at: new Date().toISOString() })
-          .eq('id', checkId);
-        if (updateError) {
-          console.error('Failed to update check status:', updateError);
-        } else if (onRefreshChecks) {
-          onRefreshChecks();
+      // Skip the write (and the checks refetch it triggers) when the status did not change
+      if (checkStatus === check.status) {
+        console.log('📊 Check status unchanged, skipping status update');
+      } else {
+        try {
+          const { createClient } = await import('@supabase/supabase-js');
+          const supabase = createClient(
+            import.meta.env.VITE_SUPABASE_URL,
+            import.meta.env.VITE_SUPABASE_ANON_KEY
+          );
+          const { error: updateError } = await supabase
+            .from('checks')
+            .update({ status: checkStatus, updated_at: new Date().toISOString() })
+            .eq('id', checkId);
+          if (updateError) {
+            console.error('Failed to update check status:', updateError);
+          } else if (onRefreshChecks) {
+            onRefreshChecks();
+          }
+        } catch (err) {
+          console.error('Failed to update check status:', err);
         }
-      } catch (err) {
-        console.error('Failed to update check status:', err);
       }
 
       // Expand the check to show results
@@ -543,6 +543,16 @@ const GoogleSheetsEmbed = ({
       setError(null)
       setLastDataHash(currentDataHash)
       
+      // Collect currency and formula cells in one walk over the grid
+      const currencyCells = []
+      const formulaCells = []
+      for (const row of spreadsheetData) {
+        for (const cell of row) {
+          if (cell.isCurrency) currencyCells.push(cell)
+          if (cell.isFormula) formulaCells.push(cell)
+        }
+      }
+      
       console.log('🔄 Google Sheets sync successful:', {
         rowCount: values.length,
         dataPreview: spreadsheetData.slice(0, 3),
@@ -553,8 +563,8 @@ const GoogleSheetsEmbed = ({
         cellC1: spreadsheetData[0]?.[2], // Column C (index 2)
         cellC4: spreadsheetData[3]?.[2], // Row 4, Column C
         rawDataPreview: values.slice(0, 3), // Show raw data
-        currencyCells: spreadsheetData.flat().filter(cell => cell.isCurrency),
-        formulaCells: spreadsheetData.flat().filter(cell => cell.isFormula)
+        currencyCells,
+        formulaCells
       })
       
       if (onSheetDataUpdate) {
@@ -607,6 +617,7 @@ const GoogleSheetsEmbed = ({
       
       // Prepare data for insertion first (don't delete until we're sure we have data)
       const cellsToInsert = []
+      const savedAt = new Date().toISOString()
       
       spreadsheetData.forEach((row, rowIndex) => {
         row.forEach((cell, colIndex) => {
@@ -626,8 +637,8 @@ const GoogleSheetsEmbed = ({
               is_percentage: cell.isPercentage || false,
               formatting: cell.formatting || null,
               decimal_places: cell.decimalPlaces || null,
-              created_at: new Date().toISOString(),
-              updated_at: new Date().toISOString()
+              created_at: savedAt,
+              updated_at: savedAt
             })
           }
         })
@@ -1111,8 +1122,13 @@ function ReadOnlySheet({ spreadsheetId }) {
 
         if (error) throw error
 
-        const maxRow = (data?.length ? Math.max(...data.map(c => c.row_index)) : 0) || 0
-        const maxCol = (data?.length ? Math.max(...data.map(c => c.col_index)) : 0) || 0
+        // Single pass for both bounds (spreading large arrays into Math.max also risks a stack overflow)
+        let maxRow = 0
+        let maxCol = 0
+        for (const cell of data || []) {
+          if (cell.row_index > maxRow) maxRow = cell.row_index
+          if (cell.col_index > maxCol) maxCol = cell.col_index
+        }
         const rows = Math.max(maxRow + 1, 20)
         const cols = Math.max(maxCol + 1, 10)
 
@@ -135,12 +135,13 @@ const Organizations = ({
         ));
       } else {
         // Add new integration
+        const now = new Date().toISOString();
         const integration = {
           id: Date.now().toString(), // Temporary ID
           organization_id: currentOrganizationId,
           ...newIntegration,
-          created_at: new Date().toISOString(),
-          updated_at: new Date().toISOString()
+          created_at: now,
+          updated_at: now
         };
         setIntegrations(prev => [...prev, integration]);
       }
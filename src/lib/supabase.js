@@ -320,12 +320,13 @@ export const userService = {
 
   // Reset monthly token balance (for new month)
   async resetTokenBalance(userId) {
+    const now = new Date().toISOString()
     const { data, error } = await supabase
       .from('user_profiles')
       .update({
         monthly_token_balance: 0,
-        token_reset_date: new Date().toISOString(),
-        updated_at: new Date().toISOString()
+        token_reset_date: now,
+        updated_at: now
       })
       .eq('id', userId)
       .select()
@@ -552,23 +553,41 @@ export const cellService = {
     }
     
     
-    // Delete cells that are now empty
+    // Delete cells that are now empty, one request per batch instead of one per cell
     if (cellsToDelete.length > 0) {
-      try {
-        for (const cellToDelete of cellsToDelete) {
+      // Keep the or= filter short enough to fit in the request URL
+      const batchSize = 100
+      for (let i = 0; i < cellsToDelete.length; i += batchSize) {
+        const batch = cellsToDelete.slice(i, i + batchSize)
+        try {
           const { error } = await supabase
             .from('spreadsheet_cells')
             .delete()
             .eq('spreadsheet_id', spreadsheetId)
-            .eq('row_index', cellToDelete.row_index)
-            .eq('col_index', cellToDelete.col_index)
+            .or(batch.map(cell => `and(row_index.eq.${cell.row_index},col_index.eq.${cell.col_index})`).join(','))
           
-          if (error) {
-            console.warn('cellService.saveCells: Error deleting cell:', cellToDelete, error)
+          if (error) throw error
+        } catch (error) {
+          console.error('cellService.saveCells: Failed to delete cells:', error)
+          // Fallback to individual deletes to isolate the failing cell
+          // A failed delete is logged and skipped so the upsert below still runs
+          for (const cellToDelete of batch) {
+            try {
+              const { error } = await supabase
+                .from('spreadsheet_cells')
+                .delete()
+                .eq('spreadsheet_id', spreadsheetId)
+                .eq('row_index', cellToDelete.row_index)
+                .eq('col_index', cellToDelete.col_index)
+              
+              if (error) {
+                console.warn('cellService.saveCells: Error deleting cell:', cellToDelete, error)
+              }
+            } catch (error) {
+              console.warn('cellService.saveCells: Error deleting cell:', cellToDelete, error)
+            }
           }
         }
-      } catch (error) {
-        console.error('cellService.saveCells: Failed to delete cells:', error)
       }
     }
     
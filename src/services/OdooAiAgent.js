@@ -1,6 +1,291 @@
 /* eslint-env node */
 import OpenAI from 'openai';
 
+// Verbose Odoo XML-RPC logging (raw XML payloads, per-record parse output).
+// Off by default: on large reads, building these strings costs more than the parse itself.
+const DEBUG_ODOO = process.env.ODOO_DEBUG === 'true';
+
+// Odoo UIDs per (url, db, username, apiKey). authenticate returns a stable UID for the
+// same credentials, so every XML-RPC call after the first can skip that round trip.
+// Pending lookups are cached too, so concurrent callers share a single authenticate.
+// Entries expire so a deactivated user or revoked key is noticed by warm instances.
+const odooUidCache = new Map();
+const ODOO_UID_CACHE_TTL_MS = 60 * 60 * 1000;
+
+// Tool lists reported by each MCP server (tools/list). They only change when the server
+// is redeployed, so warm instances reuse them instead of asking on every initialize.
+// Only successful responses are cached; the default-tools fallback is retried next time.
+const mcpToolsCache = new Map();
+
+// Accounting model names per Odoo database (url + db). ir.model only changes when
+// modules are installed, so the listing is reused for a few minutes; like the UID
+// cache, pending lookups are shared so concurrent initializations query Odoo once.
+const odooModelsCache = new Map();
+const ODOO_MODELS_CACHE_TTL_MS = 5 * 60 * 1000;
+
+// Connection-level failures (reset or refused sockets, DNS blips) on idempotent Odoo
+// calls are retried with a short backoff. undici reports these as a TypeError. Timeouts
+// and HTTP errors are not retried, and all attempts share the caller's abort signal,
+// so a retry never extends the request's overall time budget.
+const ODOO_FETCH_ATTEMPTS = 3;
+const fetchOdooWithRetry = async (url, options) => {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fetch(url, options);
+    } catch (error) {
+      if (!(error instanceof TypeError) || attempt >= ODOO_FETCH_ATTEMPTS) {
+        throw error;
+      }
+      console.warn(`⚠️ Odoo request failed (${error.cause?.code || error.message}), retrying (${attempt}/${ODOO_FETCH_ATTEMPTS - 1})`);
+      await new Promise(resolve => setTimeout(resolve, 100 * 2 ** (attempt - 1)));
+    }
+  }
+};
+
+// POST an XML-RPC body to Odoo and return the response XML, raising on non-2xx status.
+// Only pass retry for idempotent calls: execute_method may run methods that write.
+const postOdooXml = async (url, body, { label, timeoutMs = 5000, retry = false }) => {
+  const response = await (retry ? fetchOdooWithRetry : fetch)(url, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/xml',
+      'User-Agent': 'Netlify-Function/1.0'
+    },
+    body,
+    signal: AbortSignal.timeout(timeoutMs)
+  });
+
+  if (!response.ok) {
+    throw new Error(`${label} HTTP ${response.status}: ${response.statusText}`);
+  }
+
+  return response.text();
+};
+
+const unescapeXml = (text) => text
+  .replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&amp;/g, '&').replace(/&quot;/g, '"');
+
+// Extract { faultCode, faultString } from an XML-RPC <fault> response, or null if the
+// response is not a fault. faultCode is a number when Odoo sends one (3 = access denied).
+const parseOdooFault = (xml) => {
+  if (!xml.includes('<fault>')) {
+    return null;
+  }
+
+  const codeMatch = xml.match(/<name>faultCode<\/name>\s*<value>\s*<(?:int|i4)>(-?\d+)<\/(?:int|i4)>/);
+  const faultCode = codeMatch ? parseInt(codeMatch[1]) : null;
+
+  // Try multiple patterns to extract fault string
+  let faultString = 'Unknown error';
+  // Pattern 1: <faultString><string>...</string></faultString> (most common)
+  const faultMatch1 = xml.match(/<faultString>[\s\S]*?<string>([\s\S]*?)<\/string>[\s\S]*?<\/faultString>/);
+  // Pattern 2: <fault><value><struct><member><name>faultString</name>...
+  const faultMatch2 = xml.match(/<name>faultString<\/name>[\s\S]*?<value>[\s\S]*?<string>([\s\S]*?)<\/string>/);
+  // Pattern 3: any text between fault tags
+  const faultMatch3 = xml.match(/<fault>[\s\S]*?<value>[\s\S]*?<string>([\s\S]*?)<\/string>[\s\S]*?<\/value>[\s\S]*?<\/fault>/);
+  const faultMatch = [faultMatch1, faultMatch2, faultMatch3].find(match => match && match[1]);
+  if (faultMatch) {
+    faultString = unescapeXml(faultMatch[1].trim());
+  }
+
+  return { faultCode, faultString };
+};
+
+const isOdooAccessDenied = (fault) => fault.faultCode === 3 || fault.faultString === 'Access Denied';
+
+// Error for an XML-RPC fault; the parsed fault stays available as error.odooFault
+const createOdooFaultError = (fault, message = fault.faultString) => {
+  const error = new Error(`Odoo error: ${message}`);
+  error.odooFault = fault;
+  return error;
+};
+
+// Fields every Odoo config (organization or env fallback) must provide
+const REQUIRED_ODOO_CONFIG_FIELDS = Object.freeze(['url', 'db', 'username', 'apiKey']);
+
+// Fallback Odoo config from environment variables, read once per process instead of
+// on every initialize (each process.env access goes through a native getter)
+let envOdooConfig = null;
+const getEnvOdooConfig = () => {
+  if (!envOdooConfig) {
+    envOdooConfig = Object.freeze({
+      url: process.env.ODOO_URL,
+      db: process.env.ODOO_DB,
+      username: process.env.ODOO_USERNAME,
+      apiKey: process.env.ODOO_API_KEY
+    });
+  }
+  return envOdooConfig;
+};
+
+// Default MCP tools, matching https://github.com/tuanle96/mcp-odoo/.
+// Built once at module load instead of on every getDefaultMCPTools() call.
+const DEFAULT_MCP_TOOLS = Object.freeze([
+  {
+    type: "function",
+    function: {
+      name: "execute_method",
+      description: "Execute any Odoo model method. Use this to: (1) Discover models - call ir.model.search_read([], {'fields':['model','name'], 'limit':100}) to list all models; (2) Discover fields - call model.fields_get() to get field definitions with 'help' text explaining each field's purpose; (3) Search records - call model.search_read([['field','operator',value]], {'fields':['field1','field2'], 'limit':100}) where domain is array like [['account_id.code','in',['700100']]]; (4) Read records - call model.read([1,2,3], {'fields':['field1','field2']}). Domain operators: '=', '!=', '>', '<', '>=', '<=', 'in', 'like', 'ilike'. MCP resources: odoo://models lists all models, odoo://model/{model_name} returns model info with fields including help text.",
+      parameters: {
+        type: "object",
+        properties: {
+          model: {
+            type: "string",
+            description: "Odoo model name (e.g., 'res.partner', 'account.move.line', 'ir.model')"
+          },
+          method: {
+            type: "string",
+            description: "Method name: 'fields_get' (returns field metadata including help text), 'search_read' (search and read records), 'read' (read by IDs), 'search' (search IDs only)"
+          },
+          args: {
+            type: "array",
+            description: "Positional arguments. For fields_get: []. For search_read: [[domain]] where domain is array like [['field','operator',value]]. For read: [[id1,id2]] array of integers.",
+            items: {}
+          },
+          kwargs: {
+            type: "object",
+            description: "Keyword arguments. Common: {'fields':['field1','field2']} for fields to fetch, {'limit':100} for result limit, {'offset':0} for pagination.",
+            additionalProperties: true
+          }
+        },
+        required: ["model", "method"]
+      }
+    }
+  },
+  {
+    type: "function",
+    function: {
+      name: "search_employee",
+      description: "Search for employees by name. Use execute_method with model 'hr.employee' and method 'search_read' for more flexible searches.",
+      parameters: {
+        type: "object",
+        properties: {
+          name: {
+            type: "string",
+            description: "Name or part of name to search"
+          },
+          limit: {
+            type: "number",
+            description: "Maximum results (default: 20)",
+            default: 20
+          }
+        },
+        required: ["name"]
+      }
+    }
+  },
+  {
+    type: "function",
+    function: {
+      name: "search_holidays",
+      description: "Search for holidays by date range. Use execute_method with model 'hr.leave' and method 'search_read' for more flexible searches.",
+      parameters: {
+        type: "object",
+        properties: {
+          start_date: {
+            type: "string",
+            description: "Start date (YYYY-MM-DD)"
+          },
+          end_date: {
+            type: "string",
+            description: "End date (YYYY-MM-DD)"
+          },
+          employee_id: {
+            type: "number",
+            description: "Optional employee ID filter"
+          }
+        },
+        required: ["start_date", "end_date"]
+      }
+    }
+  }
+]);
+
+// Basic accounting models used for AI context when the dynamic ir.model fetch fails
+const FALLBACK_ODOO_MODELS = Object.freeze([
+  'account.move',
+  'account.move.line', 
+  'account.account',
+  'res.partner',
+  'product.product',
+  'sale.order',
+  'purchase.order'
+]);
+
+// Result fields saved as separate database columns (excluded from result_data)
+const RESULT_DATA_EXCLUDED_FIELDS = new Set([
+  'success', 'status', 'duration', 'queryPlan', 'query', 'count', 
+  'records', 'data', 'llmAnalysis', 'tokensUsed', 'steps', 'error', 'timestamp', 'resultData'
+]);
+
+// XML-RPC value serializers for the build*XML helpers. Defined once at module
+// scope rather than as closures re-created on every build call.
+
+// Positional args: plain values and (nested) arrays
+const serializeArgValue = (v) => {
+  if (Array.isArray(v)) {
+    return `<array><data>${v.map(item => `<value>${serializeArgValue(item)}</value>`).join('')}</data></array>`;
+  }
+  if (typeof v === 'number' && Number.isFinite(v)) {
+    return `<i4>${v}</i4>`;
+  }
+  if (typeof v === 'boolean') {
+    return `<boolean>${v ? 1 : 0}</boolean>`;
+  }
+  if (v === null || v === undefined) {
+    return `<nil/>`;
+  }
+  return `<string>${String(v)}</string>`;
+};
+
+// Keyword args: strings are XML-escaped, nested arrays cover domain triplets
+const serializeKwargValue = (v) => {
+  if (Array.isArray(v)) {
+    // Handle arrays - each element should be serialized
+    const arrayItems = v.map(item => {
+      if (Array.isArray(item)) {
+        // Nested array (e.g., domain triplets)
+        return `<value><array><data>${item.map(subItem => `<value>${serializeKwargValue(subItem)}</value>`).join('')}</data></array></value>`;
+      }
+      return `<value>${serializeKwargValue(item)}</value>`;
+    });
+    return `<array><data>${arrayItems.join('')}</data></array>`;
+  }
+  if (typeof v === 'number' && Number.isFinite(v)) {
+    return `<i4>${v}</i4>`;
+  }
+  if (typeof v === 'boolean') {
+    return `<boolean>${v ? 1 : 0}</boolean>`;
+  }
+  if (v === null || v === undefined) {
+    return `<nil/>`;
+  }
+  if (typeof v === 'string') {
+    // Escape XML special characters
+    return `<string>${v.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')}</string>`;
+  }
+  return `<string>${String(v)}</string>`;
+};
+
+// Domain values: array items (e.g. 'in' operands) are sent as strings
+const serializeDomainValue = (v) => {
+  if (Array.isArray(v)) {
+    // Array of values
+    return `<array><data>${v.map(item => `<value><string>${String(item)}</string></value>`).join('')}</data></array>`;
+  }
+  if (typeof v === 'number' && Number.isFinite(v)) {
+    return `<i4>${v}</i4>`;
+  }
+  if (typeof v === 'boolean') {
+    return `<boolean>${v ? 1 : 0}</boolean>`;
+  }
+  if (v === null || v === undefined) {
+    return `<nil/>`;
+  }
+  // Default to string
+  return `<string>${String(v)}</string>`;
+};
+
 /**
  * Odoo AI Agent Service
  * Single source of truth for AI-driven Odoo queries and analysis
@@ -16,6 +301,7 @@ export class OdooAiAgent {
     this.customConfig = customConfig;
     this.mcpTools = [];
     this.mcpServerUrl = null;
+    this.initializationError = null; // Set when initialize() returns false, for callers to report
   }
 
   async initialize(customConfig = null) {
@@ -44,13 +330,21 @@ export class OdooAiAgent {
       // Initialize MCP services based on environment
       await this.initializeMCPServices();
 
-      // Load available models and fields for AI context
-      await this.loadOdooMetadata();
+      // MCP tools and Odoo metadata (models for AI context) come from different
+      // servers, so fetch them concurrently instead of paying both latencies in turn
+      await Promise.all([
+        this.fetchMCPTools(),
+        this.loadOdooMetadata()
+      ]);
+      
+      // Log MCP connection status
+      console.log(`📋 MCP Integration Status: ${this.mcpTools.length} tools available`);
 
       console.log('🤖 Odoo AI Agent initialized successfully');
       return true;
     } catch (error) {
       console.error('❌ Failed to initialize Odoo AI Agent:', error);
+      this.initializationError = error;
       return false;
     }
   }
@@ -92,20 +386,17 @@ export class OdooAiAgent {
       } else {
         console.log('⚠️ No custom config provided, using environment variables as fallback');
         // Fallback to environment variables if no custom config
-        this.odooConfig = {
-          url: process.env.ODOO_URL,
-          db: process.env.ODOO_DB,
-          username: process.env.ODOO_USERNAME,
-          apiKey: process.env.ODOO_API_KEY
-        };
+        this.odooConfig = getEnvOdooConfig();
         console.log('✅ Initialized with environment variables');
       }
       
-      // Try to fetch MCP tools (will fallback to defaults if MCP server unavailable)
-      await this.fetchMCPTools();
-      
-      // Log MCP connection status
-      console.log(`📋 MCP Integration Status: ${this.mcpTools.length} tools available`);
+      // Fail fast on incomplete config instead of sending requests to "undefined/xmlrpc/..."
+      const missingFields = REQUIRED_ODOO_CONFIG_FIELDS.filter(field => !this.odooConfig[field]);
+      if (missingFields.length > 0) {
+        const configError = new Error(`Incomplete Odoo configuration, missing: ${missingFields.join(', ')}`);
+        configError.missingFields = missingFields;
+        throw configError;
+      }
     } catch (error) {
       console.error('❌ Odoo configuration initialization failed:', error);
       throw error;
@@ -116,6 +407,13 @@ export class OdooAiAgent {
    * Fetch available tools from MCP server
    */
   async fetchMCPTools() {
+    const cachedTools = mcpToolsCache.get(this.mcpServerUrl);
+    if (cachedTools) {
+      this.mcpTools = cachedTools;
+      console.log(`✅ Using cached MCP tools: ${this.mcpTools.length} tools`);
+      return;
+    }
+    
     try {
       // MCP servers typically expose tools via JSON-RPC, but if wrapped in HTTP, try that first
       // Try to connect via HTTP POST with JSON-RPC format
@@ -140,6 +438,7 @@ export class OdooAiAgent {
           const data = await response.json();
           if (data.result && data.result.tools) {
             this.mcpTools = this.convertMCPToolsToOpenAI(data.result.tools);
+            mcpToolsCache.set(this.mcpServerUrl, this.mcpTools);
             console.log(`✅ Fetched ${this.mcpTools.length} MCP tools:`, this.mcpTools.map(t => t.function.name));
             return;
           }
@@ -164,86 +463,7 @@ export class OdooAiAgent {
    * These match the tools from https://github.com/tuanle96/mcp-odoo/
    */
   getDefaultMCPTools() {
-    return [
-      {
-        type: "function",
-        function: {
-          name: "execute_method",
-          description: "Execute any Odoo model method. Use this to: (1) Discover models - call ir.model.search_read([], {'fields':['model','name'], 'limit':100}) to list all models; (2) Discover fields - call model.fields_get() to get field definitions with 'help' text explaining each field's purpose; (3) Search records - call model.search_read([['field','operator',value]], {'fields':['field1','field2'], 'limit':100}) where domain is array like [['account_id.code','in',['700100']]]; (4) Read records - call model.read([1,2,3], {'fields':['field1','field2']}). Domain operators: '=', '!=', '>', '<', '>=', '<=', 'in', 'like', 'ilike'. MCP resources: odoo://models lists all models, odoo://model/{model_name} returns model info with fields including help text.",
-          parameters: {
-            type: "object",
-            properties: {
-              model: {
-                type: "string",
-                description: "Odoo model name (e.g., 'res.partner', 'account.move.line', 'ir.model')"
-              },
-              method: {
-                type: "string",
-                description: "Method name: 'fields_get' (returns field metadata including help text), 'search_read' (search and read records), 'read' (read by IDs), 'search' (search IDs only)"
-              },
-              args: {
-                type: "array",
-                description: "Positional arguments. For fields_get: []. For search_read: [[domain]] where domain is array like [['field','operator',value]]. For read: [[id1,id2]] array of integers.",
-                items: {}
-              },
-              kwargs: {
-                type: "object",
-                description: "Keyword arguments. Common: {'fields':['field1','field2']} for fields to fetch, {'limit':100} for result limit, {'offset':0} for pagination.",
-                additionalProperties: true
-              }
-            },
-            required: ["model", "method"]
-          }
-        }
-      },
-      {
-        type: "function",
-        function: {
-          name: "search_employee",
-          description: "Search for employees by name. Use execute_method with model 'hr.employee' and method 'search_read' for more flexible searches.",
-          parameters: {
-            type: "object",
-            properties: {
-              name: {
-                type: "string",
-                description: "Name or part of name to search"
-              },
-              limit: {
-                type: "number",
-                description: "Maximum results (default: 20)",
-                default: 20
-              }
-            },
-            required: ["name"]
-          }
-        }
-      },
-      {
-        type: "function",
-        function: {
-          name: "search_holidays",
-          description: "Search for holidays by date range. Use execute_method with model 'hr.leave' and method 'search_read' for more flexible searches.",
-          parameters: {
-            type: "object",
-            properties: {
-              start_date: {
-                type: "string",
-                description: "Start date (YYYY-MM-DD)"
-              },
-              end_date: {
-                type: "string",
-                description: "End date (YYYY-MM-DD)"
-              },
-              employee_id: {
-                type: "number",
-                description: "Optional employee ID filter"
-              }
-            },
-            required: ["start_date", "end_date"]
-          }
-        }
-      }
-    ];
+    return DEFAULT_MCP_TOOLS;
   }
   
   /**
@@ -380,118 +600,36 @@ export class OdooAiAgent {
     try {
       console.log(`🔧 Executing Odoo method: ${model}.${method}`, { args, kwargs });
       
-      // Authenticate
       const xmlrpcUrl = `${this.odooConfig.url}/xmlrpc/2/object`;
-      const authUrl = xmlrpcUrl.replace('/xmlrpc/2/object', '/xmlrpc/2/common');
-      
-      const authResponse = await fetch(authUrl, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/xml' },
-        body: `<?xml version="1.0"?>
-<methodCall>
-  <methodName>authenticate</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><string>${this.odooConfig.username}</string></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><struct></struct></value></param>
-  </params>
-</methodCall>`,
-        signal: AbortSignal.timeout(3000)
-      });
-      
-      if (!authResponse.ok) {
-        throw new Error(`Auth HTTP ${authResponse.status}: ${authResponse.statusText}`);
-      }
-      
-      const authXml = await authResponse.text();
-      const uidMatch = authXml.match(/<value><(?:i4|int)>(\d+)<\/(?:i4|int)><\/value>/);
-      if (!uidMatch) {
-        throw new Error('Failed to authenticate');
-      }
-      
-      const uid = parseInt(uidMatch[1]);
-      console.log(`✅ Authenticated with Odoo, UID: ${uid}`);
       
       // Build execute_kw XML request
       // Format: execute_kw(db, uid, password, model, method, args, kwargs)
       const argsXml = this.buildArgsXML(args);
       const kwargsXml = this.buildKwargsXML(kwargs);
       
-      const executeBody = `<?xml version="1.0"?>
-<methodCall>
-  <methodName>execute_kw</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><i4>${uid}</i4></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><string>${model}</string></value></param>
-    <param><value><string>${method}</string></value></param>
-    <param><value><array><data>${argsXml}</data></array></value></param>
-    <param><value><struct>${kwargsXml}</struct></value></param>
-  </params>
-</methodCall>`;
-      
-      // Log XML for debugging
-      console.log(`📤 ${model}.${method} XML request length:`, executeBody.length);
-      if (method === 'search_read') {
+      if (DEBUG_ODOO && method === 'search_read') {
         console.log(`📤 ${model}.${method} args:`, JSON.stringify(args));
         console.log(`📤 ${model}.${method} kwargs:`, JSON.stringify(kwargs));
         console.log(`📤 ${model}.${method} kwargs XML:`, kwargsXml.substring(0, 500));
       }
       
-      const executeResponse = await fetch(xmlrpcUrl, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/xml' },
-        body: executeBody,
-        signal: AbortSignal.timeout(5000)
-      });
-      
-      if (!executeResponse.ok) {
-        throw new Error(`Execute HTTP ${executeResponse.status}: ${executeResponse.statusText}`);
-      }
-      
-      const executeXml = await executeResponse.text();
-      
-      // Check for XML-RPC fault
-      if (executeXml.includes('<fault>')) {
-        // Log raw XML for debugging
-        console.error(`❌ Odoo XML-RPC fault response (first 1000 chars):`, executeXml.substring(0, 1000));
-        
-        // Try multiple patterns to extract fault string
-        let faultString = 'Unknown error';
-        
-        // Pattern 1: <faultString><string>...</string></faultString> (most common)
-        const faultMatch1 = executeXml.match(/<faultString>[\s\S]*?<string>([\s\S]*?)<\/string>[\s\S]*?<\/faultString>/);
-        if (faultMatch1 && faultMatch1[1]) {
-          faultString = faultMatch1[1].trim();
-          // Unescape XML entities
-          faultString = faultString.replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&amp;/g, '&').replace(/&quot;/g, '"');
-        } else {
-          // Pattern 2: Try to extract from <fault><value><struct><member><name>faultString</name>...
-          const faultMatch2 = executeXml.match(/<name>faultString<\/name>[\s\S]*?<value>[\s\S]*?<string>([\s\S]*?)<\/string>/);
-          if (faultMatch2 && faultMatch2[1]) {
-            faultString = faultMatch2[1].trim();
-            faultString = faultString.replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&amp;/g, '&').replace(/&quot;/g, '"');
-          } else {
-            // Pattern 3: Try to extract any text between fault tags
-            const faultMatch3 = executeXml.match(/<fault>[\s\S]*?<value>[\s\S]*?<string>([\s\S]*?)<\/string>[\s\S]*?<\/value>[\s\S]*?<\/fault>/);
-            if (faultMatch3 && faultMatch3[1]) {
-              faultString = faultMatch3[1].trim();
-              faultString = faultString.replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&amp;/g, '&').replace(/&quot;/g, '"');
-            }
-          }
+      let executeXml;
+      try {
+        executeXml = await this.executeKwWithFetch(xmlrpcUrl, model, method, argsXml, kwargsXml,
+          { label: 'Execute' });
+      } catch (executeError) {
+        if (!executeError.odooFault) {
+          throw executeError;
         }
-        
         // Extract first few lines of error for readability
-        const faultLines = faultString.split('\n');
+        const faultLines = executeError.odooFault.faultString.split('\n');
         const shortFault = faultLines.length > 10 
           ? faultLines.slice(0, 10).join('\n') + '\n... (truncated)'
-          : faultString;
+          : executeError.odooFault.faultString;
         
         console.error(`❌ Odoo XML-RPC fault:`, shortFault);
         console.error(`❌ Request was:`, { model, method, args, kwargs });
-        throw new Error(`Odoo error: ${shortFault}`);
+        throw createOdooFaultError(executeError.odooFault, shortFault);
       }
       
       const result = this.parseXMLResponse(executeXml);
@@ -515,6 +653,65 @@ export class OdooAiAgent {
     }
   }
   
+  /**
+   * Build an execute_kw XML-RPC request with db and API key bound from the current config
+   * Format: execute_kw(db, uid, password, model, method, args, kwargs)
+   * argsXml is the content of the args <data> array, kwargsXml the <member>s of the kwargs <struct>
+   */
+  buildExecuteKwXML(uid, model, method, argsXml = '', kwargsXml = '') {
+    return `<?xml version="1.0"?>
+<methodCall>
+  <methodName>execute_kw</methodName>
+  <params>
+    <param><value><string>${this.odooConfig.db}</string></value></param>
+    <param><value><i4>${uid}</i4></value></param>
+    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
+    <param><value><string>${model}</string></value></param>
+    <param><value><string>${method}</string></value></param>
+    <param><value><array><data>${argsXml}</data></array></value></param>
+    <param><value><struct>${kwargsXml}</struct></value></param>
+  </params>
+</methodCall>`;
+  }
+
+  /**
+   * Run execute_kw with the cached UID and return the response XML
+   * Faults are raised with error.odooFault. If Odoo rejects the cached UID (access denied),
+   * it is dropped and the call is sent once more with a fresh login.
+   */
+  async executeKwWithFetch(xmlrpcUrl, model, method, argsXml, kwargsXml, postOptions) {
+    const send = async () => {
+      const uid = await this.authenticateOdooWithFetch(xmlrpcUrl);
+      const body = this.buildExecuteKwXML(uid, model, method, argsXml, kwargsXml);
+      console.log(`📤 ${model}.${method} XML request length:`, body.length);
+      if (DEBUG_ODOO) {
+        console.log(`📤 ${model}.${method} XML (first 600 chars):`, body.substring(0, 600));
+      }
+      
+      const xml = await postOdooXml(xmlrpcUrl, body, postOptions);
+      
+      // Faults arrive as HTTP 200; a fault body is never a result
+      const fault = parseOdooFault(xml);
+      if (fault) {
+        console.error(`❌ Odoo ${model}.${method} fault response (first 1000 chars):`, xml.substring(0, 1000));
+        throw createOdooFaultError(fault);
+      }
+      return xml;
+    };
+    
+    try {
+      return await send();
+    } catch (error) {
+      if (!error.odooFault || !isOdooAccessDenied(error.odooFault)) {
+        throw error;
+      }
+      // The cached UID was rejected (e.g. the user was recreated); log in again once
+      console.log('🔄 Odoo rejected cached UID, re-authenticating');
+      this.forgetOdooUid();
+      return send();
+    }
+  }
+
   /**
    * Build XML for positional arguments
    */
@@ -523,23 +720,7 @@ export class OdooAiAgent {
       return '';
     }
     
-    const serializeValue = (v) => {
-      if (Array.isArray(v)) {
-        return `<array><data>${v.map(item => `<value>${serializeValue(item)}</value>`).join('')}</data></array>`;
-      }
-      if (typeof v === 'number' && Number.isFinite(v)) {
-        return `<i4>${v}</i4>`;
-      }
-      if (typeof v === 'boolean') {
-        return `<boolean>${v ? 1 : 0}</boolean>`;
-      }
-      if (v === null || v === undefined) {
-        return `<nil/>`;
-      }
-      return `<string>${String(v)}</string>`;
-    };
-    
-    return args.map(arg => `<value>${serializeValue(arg)}</value>`).join('');
+    return args.map(arg => `<value>${serializeArgValue(arg)}</value>`).join('');
   }
   
   /**
@@ -550,38 +731,10 @@ export class OdooAiAgent {
       return '';
     }
     
-    const serializeValue = (v) => {
-      if (Array.isArray(v)) {
-        // Handle arrays - each element should be serialized
-        const arrayItems = v.map(item => {
-          if (Array.isArray(item)) {
-            // Nested array (e.g., domain triplets)
-            return `<value><array><data>${item.map(subItem => `<value>${serializeValue(subItem)}</value>`).join('')}</data></array></value>`;
-          }
-          return `<value>${serializeValue(item)}</value>`;
-        });
-        return `<array><data>${arrayItems.join('')}</data></array>`;
-      }
-      if (typeof v === 'number' && Number.isFinite(v)) {
-        return `<i4>${v}</i4>`;
-      }
-      if (typeof v === 'boolean') {
-        return `<boolean>${v ? 1 : 0}</boolean>`;
-      }
-      if (v === null || v === undefined) {
-        return `<nil/>`;
-      }
-      if (typeof v === 'string') {
-        // Escape XML special characters
-        return `<string>${v.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')}</string>`;
-      }
-      return `<string>${String(v)}</string>`;
-    };
-    
     return Object.entries(kwargs).map(([key, value]) => {
       return `<member>
         <name>${key}</name>
-        <value>${serializeValue(value)}</value>
+        <value>${serializeKwargValue(value)}</value>
       </member>`;
     }).join('');
   }
@@ -685,15 +838,7 @@ export class OdooAiAgent {
         } catch (error) {
           console.warn('⚠️ Failed to fetch dynamic models, using fallback:', error.message);
           // Fallback to basic models if dynamic fetch fails
-          this.availableModels = [
-            'account.move',
-            'account.move.line', 
-            'account.account',
-            'res.partner',
-            'product.product',
-            'sale.order',
-            'purchase.order'
-          ];
+          this.availableModels = FALLBACK_ODOO_MODELS;
           console.log('✅ Loaded fallback Odoo models for AI context');
         }
       } else {
@@ -708,72 +853,50 @@ export class OdooAiAgent {
 
   /**
    * Fetch available models from Odoo
+   * Reuses a recent listing for the same database
    */
   async fetchOdooModels() {
-    try {
-      // First authenticate to get UID
-      const xmlrpcUrl = `${this.odooConfig.url}/xmlrpc/2/object`;
-      const authUrl = xmlrpcUrl.replace('/xmlrpc/2/object', '/xmlrpc/2/common');
-      
-      const authResponse = await fetch(authUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/xml',
-          'User-Agent': 'Netlify-Function/1.0'
-        },
-        body: `<?xml version="1.0"?>
-<methodCall>
-  <methodName>authenticate</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><string>${this.odooConfig.username}</string></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><struct></struct></value></param>
-  </params>
-</methodCall>`,
-        signal: AbortSignal.timeout(3000)
-      });
-
-      if (!authResponse.ok) {
-        throw new Error(`Auth HTTP ${authResponse.status}: ${authResponse.statusText}`);
+    const cacheKey = [this.odooConfig.url, this.odooConfig.db].join('|');
+    
+    const cached = odooModelsCache.get(cacheKey);
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.modelsPromise;
+    }
+    
+    const modelsPromise = this.requestOdooModels();
+    const entry = { modelsPromise, expiresAt: Date.now() + ODOO_MODELS_CACHE_TTL_MS };
+    odooModelsCache.set(cacheKey, entry);
+    // Failed or empty lookups are not cached; the next call asks Odoo again
+    // (loadOdooMetadata treats an empty listing as a failure too)
+    const evict = () => {
+      if (odooModelsCache.get(cacheKey) === entry) {
+        odooModelsCache.delete(cacheKey);
       }
-
-      const authXml = await authResponse.text();
-      const uidMatch = authXml.match(/<value><(?:i4|int)>(\d+)<\/(?:i4|int)><\/value>/);
-      if (!uidMatch) {
-        throw new Error('Failed to parse UID from auth response');
+    };
+    modelsPromise.then(models => {
+      if (models.length === 0) {
+        evict();
       }
+    }, evict);
+    
+    return modelsPromise;
+  }
 
-      const uid = parseInt(uidMatch[1]);
-
-      // Now fetch models using ir.model
-      const modelsResponse = await fetch(xmlrpcUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/xml',
-          'User-Agent': 'Netlify-Function/1.0'
-        },
-        body: `<?xml version="1.0"?>
-<methodCall>
-  <methodName>execute_kw</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><i4>${uid}</i4></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><string>ir.model</string></value></param>
-    <param><value><string>search_read</string></value></param>
-    <param><value><array><data></data></array></value></param>
-    <param><value><struct><member><name>fields</name><value><array><data><value><string>model</string></value><value><string>name</string></value></data></array></value></member><member><name>limit</name><value><i4>100</i4></value></member></struct></value></param>
-  </params>
-</methodCall>`,
-        signal: AbortSignal.timeout(5000)
-      });
-
-      if (!modelsResponse.ok) {
-        throw new Error(`Models HTTP ${modelsResponse.status}: ${modelsResponse.statusText}`);
-      }
+  /**
+   * Query ir.model for the accounting models
+   */
+  async requestOdooModels() {
+    try {
+      const xmlrpcUrl = `${this.odooConfig.url}/xmlrpc/2/object`;
 
-      const modelsXml = await modelsResponse.text();
+      // Fetch accounting models using ir.model. The prefix filter runs in Odoo so
+      // the limit applies to account.* models only and unrelated rows are never sent.
+      // Faults are raised by executeKwWithFetch, so they never resolve to an empty listing.
+      const domainXml = this.buildDomainXML([['model', '=like', 'account.%']]);
+      const modelsXml = await this.executeKwWithFetch(xmlrpcUrl, 'ir.model', 'search_read',
+        `<value><array><data>${domainXml}</data></array></value>`,
+        this.buildKwargsXML({ fields: ['model'], limit: 100 }),
+        { label: 'Models', retry: true });
       
       // Parse models from XML response
       const modelMatches = modelsXml.match(/<member><name>model<\/name><value><string>([^<]+)<\/string><\/value><\/member>/g);
@@ -781,7 +904,7 @@ export class OdooAiAgent {
         const models = modelMatches.map(match => {
           const modelMatch = match.match(/<string>([^<]+)<\/string>/);
           return modelMatch ? modelMatch[1] : null;
-        }).filter(model => model !== null && model.startsWith('account.'));
+        }).filter(model => model !== null);
         
         console.log(`🔍 Found ${models.length} accounting models from Odoo`);
         return models;
@@ -808,7 +931,7 @@ export class OdooAiAgent {
       // Generate Odoo query using LLM
       console.log('🤖 ODOO STEP 2: Calling LLM for query generation...');
       const queryPlan = await this.analyzeCheckDescription(checkDescription, checkTitle);
-      console.log('🧠 ODOO STEP 2: LLM Generated Query:', JSON.stringify(queryPlan, null, 2));
+      console.log('🧠 ODOO STEP 2: LLM Generated Query:', JSON.stringify(queryPlan));
 
       // Execute query using direct Odoo API calls
       console.log('🔍 ODOO STEP 3: Executing query with organization-specific Odoo config...');
@@ -1125,7 +1248,7 @@ export class OdooAiAgent {
       console.log('✅ Authenticated with Odoo, UID:', uid);
 
       // Execute search and read using fetch
-      const searchResult = await this.searchOdooRecordsWithFetch(xmlrpcUrl, uid, appliedPlan);
+      const searchResult = await this.searchOdooRecordsWithFetch(xmlrpcUrl, appliedPlan);
       console.log('📊 Search result:', searchResult?.length || 0, 'records');
 
       return {
@@ -1164,8 +1287,48 @@ export class OdooAiAgent {
 
   /**
    * Authenticate with Odoo using fetch (serverless-friendly)
+   * Reuses the UID from an earlier authenticate with the same credentials
    */
   async authenticateOdooWithFetch(xmlrpcUrl) {
+    const cacheKey = this.getOdooUidCacheKey();
+    
+    const cached = odooUidCache.get(cacheKey);
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.uidPromise;
+    }
+    
+    const uidPromise = this.requestOdooUid(xmlrpcUrl);
+    const entry = { uidPromise, expiresAt: Date.now() + ODOO_UID_CACHE_TTL_MS };
+    odooUidCache.set(cacheKey, entry);
+    // Don't keep failed logins around; the next call should retry
+    uidPromise.catch(() => {
+      if (odooUidCache.get(cacheKey) === entry) {
+        odooUidCache.delete(cacheKey);
+      }
+    });
+    
+    return uidPromise;
+  }
+
+  /**
+   * Key for odooUidCache: a UID is only valid for the exact credentials that produced it
+   */
+  getOdooUidCacheKey() {
+    const { url, db, username, apiKey } = this.odooConfig;
+    return [url, db, username, apiKey].join('|');
+  }
+
+  /**
+   * Drop the cached UID for the current credentials so the next call authenticates again
+   */
+  forgetOdooUid() {
+    odooUidCache.delete(this.getOdooUidCacheKey());
+  }
+
+  /**
+   * Call Odoo's common.authenticate and parse the UID from the response
+   */
+  async requestOdooUid(xmlrpcUrl) {
     try {
       // Validate URL before making request
       if (!xmlrpcUrl || xmlrpcUrl.includes('your_odoo_url_here') || xmlrpcUrl.includes('placeholder')) {
@@ -1181,13 +1344,7 @@ export class OdooAiAgent {
         throw new Error(`Invalid Odoo URL format: ${authUrl}. Please check your ODOO_URL environment variable.`);
       }
       
-      const response = await fetch(authUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/xml',
-          'User-Agent': 'Netlify-Function/1.0'
-        },
-        body: `<?xml version="1.0"?>
+      const xmlResponse = await postOdooXml(authUrl, `<?xml version="1.0"?>
 <methodCall>
   <methodName>authenticate</methodName>
   <params>
@@ -1196,18 +1353,13 @@ export class OdooAiAgent {
     <param><value><string>${this.odooConfig.apiKey}</string></value></param>
     <param><value><struct></struct></value></param>
   </params>
-</methodCall>`,
-        signal: AbortSignal.timeout(3000) // 3 second timeout
-      });
-
-      if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-      }
+</methodCall>`, { label: 'Auth', timeoutMs: 3000, retry: true });
 
-      const xmlResponse = await response.text();
       console.log('🔐 Auth response received');
-      console.log('🔍 Auth response length:', xmlResponse.length);
-      console.log('🔍 Auth response preview:', xmlResponse.substring(0, 200) + '...');
+      if (DEBUG_ODOO) {
+        console.log('🔍 Auth response length:', xmlResponse.length);
+        console.log('🔍 Auth response preview:', xmlResponse.substring(0, 200) + '...');
+      }
       
       // Parse XML response to extract UID - handle both <i4> and <int> formats
       const uidMatch = xmlResponse.match(/<value><(?:i4|int)>(\d+)<\/(?:i4|int)><\/value>/);
@@ -1233,128 +1385,40 @@ export class OdooAiAgent {
     return this.authenticateOdooWithTimeout(client);
   }
 
-  async searchOdooRecordsWithFetch(xmlrpcUrl, uid, queryPlan) {
-      // Extra logging of model/domain before sending
-      try {
-        console.log('🔧 Odoo SEARCH - Model:', queryPlan.model);
-        console.log('🔧 Odoo SEARCH - Domain:', JSON.stringify(queryPlan.domain));
-        console.log('🔧 Odoo SEARCH - Limit:', queryPlan.limit);
-      } catch (e) {
-        // Logging failed, continue
-      }
+  async searchOdooRecordsWithFetch(xmlrpcUrl, queryPlan) {
+    // Extra logging of model/domain before sending
+    console.log('🔧 Odoo SEARCH - Model:', queryPlan.model);
+    console.log('🔧 Odoo SEARCH - Domain:', JSON.stringify(queryPlan.domain));
+    console.log('🔧 Odoo SEARCH - Limit:', queryPlan.limit);
 
     try {
-      // Build domain XML exactly as test-production-flow.js does
       const domainXml = this.buildDomainXML(queryPlan.domain || []);
       // Use limit from query plan, or default to 50, but respect the plan's limit (up to 1000)
       const limitValue = Math.min(queryPlan.limit || 50, 1000); // Use query plan limit, cap at 1000
       
-      // Log domain details for comparison with test
-      console.log('🔍 DOMAIN COMPARISON:');
       console.log('   Domain array:', JSON.stringify(queryPlan.domain || []));
       console.log('   Domain XML length:', domainXml.length);
-      console.log('   Domain XML (first 200 chars):', domainXml.substring(0, 200));
-      
-      // Build search XML exactly matching test-production-flow.js structure
-      const searchBody = `<?xml version="1.0"?>
-<methodCall>
-  <methodName>execute_kw</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><i4>${uid}</i4></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><string>${queryPlan.model}</string></value></param>
-    <param><value><string>search</string></value></param>
-    <param><value><array><data><value><array><data>${domainXml}</data></array></value></data></array></value></param>
-    <param><value><struct><member><name>limit</name><value><i4>${limitValue}</i4></value></member></struct></value></param>
-  </params>
-</methodCall>`;
-      
-      // Log generated XML for debugging
-      console.log('📤 Search XML length:', searchBody.length);
-      console.log('📤 Search XML (first 600 chars):', searchBody.substring(0, 600));
-      console.log('📤 Search XML (domain section):', searchBody.substring(searchBody.indexOf('<array><data><value><array><data>'), searchBody.indexOf('</data></array></value></data></array></value></param>') + 50));
-      
-      // First, search for record IDs
-      const searchResponse = await fetch(xmlrpcUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/xml',
-          'User-Agent': 'Netlify-Function/1.0'
-        },
-        body: searchBody,
-        signal: AbortSignal.timeout(5000) // 5 second timeout
-      });
-
-      if (!searchResponse.ok) {
-        throw new Error(`Search HTTP ${searchResponse.status}: ${searchResponse.statusText}`);
-      }
-
-      const searchXml = await searchResponse.text();
-      console.log('🔍 Search response received');
-      console.log('🔍 Search response length:', searchXml.length);
-      console.log('🔍 Search response preview:', searchXml.substring(0, 300) + '...');
-      console.log('🔍 Search response full:', searchXml); // Full response for comparison
       
-      // Parse search results to get record IDs
-      const recordIds = this.parseSearchResults(searchXml);
-      console.log('🔍 Found record IDs:', recordIds?.length || 0);
-      console.log('🔍 Record IDs:', recordIds);
-      console.log('🔍 COMPARISON: Test found [63, 59], Agent found:', recordIds);
-
-      if (!recordIds || recordIds.length === 0) {
-        console.log('📭 No records found');
-        return [];
-      }
-
-      // Then, read the records - Odoo read(ids, fields) takes both as positional args
+      // search_read resolves the domain and reads the fields server-side in one round trip,
+      // instead of a search for IDs followed by a dependent read of those IDs
       // execute_kw format: execute_kw(db, uid, password, model, method, args, kwargs)
-      // For read: args = [ids_array, fields_array], kwargs = {}
-      const idsArrayXml = `<value><array><data>${recordIds.map(id => `<value><i4>${id}</i4></value>`).join('')}</data></array></value>`;
-      const fieldsArrayXml = `<value><array><data>${this.buildFieldsXML(queryPlan.fields || [])}</data></array></value>`;
-      
-      const readBody = `<?xml version="1.0"?>
-<methodCall>
-  <methodName>execute_kw</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><i4>${uid}</i4></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><string>${queryPlan.model}</string></value></param>
-    <param><value><string>read</string></value></param>
-    <param><value><array><data>${idsArrayXml}${fieldsArrayXml}</data></array></value></param>
-    <param><value><struct></struct></value></param>
-  </params>
-</methodCall>`;
-      
-      console.log('📤 Read XML - IDs being read:', recordIds);
-      console.log('📤 Read XML length:', readBody.length);
-      console.log('📤 Read XML preview:', readBody.substring(0, 400));
-      
-      const readResponse = await fetch(xmlrpcUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/xml',
-          'User-Agent': 'Netlify-Function/1.0'
-        },
-        body: readBody,
-        signal: AbortSignal.timeout(3000) // 3 second timeout
-      });
-
-      if (!readResponse.ok) {
-        throw new Error(`Read HTTP ${readResponse.status}: ${readResponse.statusText}`);
+      // For search_read: args = [domain], kwargs = { fields, limit }
+      const readXml = await this.executeKwWithFetch(xmlrpcUrl, queryPlan.model, 'search_read',
+        `<value><array><data>${domainXml}</data></array></value>`,
+        this.buildKwargsXML({ fields: queryPlan.fields || [], limit: limitValue }),
+        { label: 'Search/read', retry: true });
+      console.log('📋 Search/read response received');
+      console.log('📋 Search/read response length:', readXml.length);
+      if (DEBUG_ODOO) {
+        console.log('📋 Search/read response full:', readXml); // Full response for debugging
       }
-
-      const readXml = await readResponse.text();
-      console.log('📋 Read response received');
-      console.log('📋 Read response length:', readXml.length);
-      console.log('📋 Read response preview:', readXml.substring(0, 500));
-      console.log('📋 Read response full:', readXml); // Full response for debugging
       
       // Parse read results
       const records = this.parseReadResults(readXml);
       console.log('📋 Read records parsed:', records?.length || 0);
-      console.log('📋 Read records detail:', JSON.stringify(records, null, 2));
+      if (DEBUG_ODOO) {
+        console.log('📋 Read records detail:', JSON.stringify(records, null, 2));
+      }
       
       return records || [];
     } catch (error) {
@@ -1363,44 +1427,17 @@ export class OdooAiAgent {
     }
   }
 
-  async readOdooRecordsWithFetch(xmlrpcUrl, uid, queryPlan, ids) {
-      try {
-        console.log('🔧 Odoo READ - Model:', queryPlan.model);
-        console.log('🔧 Odoo READ - Fields:', JSON.stringify(queryPlan.fields));
-        console.log('🔧 Odoo READ - IDs len:', Array.isArray(ids) ? ids.length : 0);
-      } catch (e) {
-        // Logging failed, continue
-      }
+  async readOdooRecordsWithFetch(xmlrpcUrl, queryPlan, ids) {
+    console.log('🔧 Odoo READ - Model:', queryPlan.model);
+    console.log('🔧 Odoo READ - Fields:', JSON.stringify(queryPlan.fields));
+    console.log('🔧 Odoo READ - IDs len:', Array.isArray(ids) ? ids.length : 0);
 
     try {
-      // Then, read the records
-      const readResponse = await fetch(xmlrpcUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/xml',
-          'User-Agent': 'Netlify-Function/1.0'
-        },
-        body: `<?xml version="1.0"?>
-<methodCall>
-  <methodName>execute_kw</methodName>
-  <params>
-    <param><value><string>${this.odooConfig.db}</string></value></param>
-    <param><value><i4>${uid}</i4></value></param>
-    <param><value><string>${this.odooConfig.apiKey}</string></value></param>
-    <param><value><string>${queryPlan.model}</string></value></param>
-    <param><value><string>read</string></value></param>
-    <param><value><array><data>${ids.map(id => `<value><i4>${id}</i4></value>`).join('')}</data></array></value></param>
-    <param><value><struct><member><name>fields</name><value><array><data>${this.buildFieldsXML(queryPlan.fields || [])}</data></array></value></member></struct></value></param>
-  </params>
-</methodCall>`,
-        signal: AbortSignal.timeout(3000) // 3 second timeout
-      });
-
-      if (!readResponse.ok) {
-        throw new Error(`Read HTTP ${readResponse.status}: ${readResponse.statusText}`);
-      }
-
-      const readXml = await readResponse.text();
+      // Then, read the records: read(ids, fields) takes the id list as one positional arg
+      const readXml = await this.executeKwWithFetch(xmlrpcUrl, queryPlan.model, 'read',
+        this.buildArgsXML([ids]),
+        this.buildKwargsXML({ fields: queryPlan.fields || [] }),
+        { label: 'Read', timeoutMs: 3000, retry: true });
       console.log('📋 Read response received');
       
       // Parse read results
@@ -1422,41 +1459,14 @@ export class OdooAiAgent {
       return '';
     }
 
-    const serializeValue = (v) => {
-      if (Array.isArray(v)) {
-        // Array of values
-        return `<array><data>${v.map(item => `<value><string>${String(item)}</string></value>`).join('')}</data></array>`;
-      }
-      if (typeof v === 'number' && Number.isFinite(v)) {
-        return `<i4>${v}</i4>`;
-      }
-      if (typeof v === 'boolean') {
-        return `<boolean>${v ? 1 : 0}</boolean>`;
-      }
-      if (v === null || v === undefined) {
-        return `<nil/>`;
-      }
-      // Default to string
-      return `<string>${String(v)}</string>`;
-    };
-
     return domain.map(condition => {
       if (Array.isArray(condition) && condition.length === 3) {
         const [field, operator, value] = condition;
-        // Special-case 'in' with array of values
-        if (operator === 'in' && Array.isArray(value)) {
-          const valueXml = `<array><data>${value.map(item => `<value><string>${String(item)}</string></value>`).join('')}</data></array>`;
-          return `<value><array><data>
-          <value><string>${field}</string></value>
-          <value><string>${operator}</string></value>
-          <value>${valueXml}</value>
-        </data></array></value>`;
-        }
-        // Generic triplet
+        // Array values ('in' operands) are serialized as string arrays by serializeDomainValue
         return `<value><array><data>
           <value><string>${field}</string></value>
           <value><string>${operator}</string></value>
-          <value>${serializeValue(value)}</value>
+          <value>${serializeDomainValue(value)}</value>
         </data></array></value>`;
       }
       // Fallback for invalid condition
@@ -1464,37 +1474,6 @@ export class OdooAiAgent {
     }).join('');
   }
 
-  /**
-   * Build fields XML for Odoo read
-   */
-  buildFieldsXML(fields) {
-    if (!fields || fields.length === 0) {
-      return '';
-    }
-    
-    return fields.map(field => `<value><string>${field}</string></value>`).join('');
-  }
-
-  /**
-   * Parse search results XML to extract record IDs
-   */
-  parseSearchResults(xml) {
-    try {
-      // Handle both <i4> and <int> formats for record IDs
-      const idMatches = xml.match(/<value><(?:i4|int)>(\d+)<\/(?:i4|int)><\/value>/g);
-      if (idMatches) {
-        return idMatches.map(match => {
-          const idMatch = match.match(/<value><(?:i4|int)>(\d+)<\/(?:i4|int)><\/value>/);
-          return idMatch ? parseInt(idMatch[1]) : null;
-        }).filter(id => id !== null);
-      }
-      return [];
-    } catch (error) {
-      console.error('❌ Failed to parse search results:', error);
-      return [];
-    }
-  }
-
   /**
    * Parse read results XML to extract records
    * Handles strings, integers, doubles, arrays (many2one), and booleans
@@ -1524,19 +1503,21 @@ export class OdooAiAgent {
         
         while ((memberMatch = memberStartPattern.exec(recordXml)) !== null) {
           const startPos = memberMatch.index;
-          // Find the matching closing </member> tag
+          // Find the matching closing </member> tag by jumping between tag occurrences
+          // with indexOf, rather than comparing substrings at every character position
           let depth = 1;
           let pos = startPos + memberMatch[0].length;
           
-          while (depth > 0 && pos < recordXml.length) {
-            if (recordXml.substring(pos, pos + 8) === '<member>') {
+          while (depth > 0) {
+            const nextClose = recordXml.indexOf('</member>', pos);
+            if (nextClose === -1) break;
+            const nextOpen = recordXml.indexOf('<member>', pos);
+            if (nextOpen !== -1 && nextOpen < nextClose) {
               depth++;
-              pos += 8;
-            } else if (recordXml.substring(pos, pos + 9) === '</member>') {
-              depth--;
-              if (depth > 0) pos += 9;
+              pos = nextOpen + 8;
             } else {
-              pos++;
+              depth--;
+              pos = depth > 0 ? nextClose + 9 : nextClose;
             }
           }
           
@@ -1616,8 +1597,10 @@ export class OdooAiAgent {
           }
         });
         
-        console.log(`📋 Record ${recordIndex + 1} parsed:`, Object.keys(record).length, 'fields');
-        console.log(`📋 Record ${recordIndex + 1} fields:`, Object.keys(record));
+        if (DEBUG_ODOO) {
+          console.log(`📋 Record ${recordIndex + 1} parsed:`, Object.keys(record).length, 'fields');
+          console.log(`📋 Record ${recordIndex + 1} fields:`, Object.keys(record));
+        }
         
         return record;
       });
@@ -1641,15 +1624,9 @@ export class OdooAiAgent {
    * Used by both local backend and Netlify functions
    */
   prepareResultData(result) {
-    // Fields saved as separate database columns (excluded from result_data)
-    const excludedFields = new Set([
-      'success', 'status', 'duration', 'queryPlan', 'query', 'count', 
-      'records', 'data', 'llmAnalysis', 'tokensUsed', 'steps', 'error', 'timestamp', 'resultData'
-    ]);
-    
     const resultData = {};
     for (const [key, value] of Object.entries(result)) {
-      if (!excludedFields.has(key) && value !== null && value !== undefined) {
+      if (!RESULT_DATA_EXCLUDED_FIELDS.has(key) && value !== null && value !== undefined) {
         resultData[key] = value;
       }
     }
@@ -1711,7 +1688,10 @@ export class OdooAiAgent {
     console.log('📋 Description:', description);
     console.log('📋 Title:', title);
     console.log('📊 Model:', queryResult.model);
-    console.log('📊 QueryResult:', JSON.stringify(queryResult, null, 2));
+    console.log('📊 QueryResult:', `${queryResult.count || 0} records`, queryResult.error ? `(error: ${queryResult.error})` : '');
+    if (DEBUG_ODOO) {
+      console.log('📊 QueryResult detail:', JSON.stringify(queryResult, null, 2));
+    }
     console.log('📋 Acceptance Criteria:', acceptanceCriteria);
 
     // Check if this is a connection error
@@ -1777,7 +1757,7 @@ Statuses:
       const userMessage = `Acceptance criteria: ${acceptanceCriteria || 'No acceptance criteria defined'}
 
 Results: ${count} records found
-${JSON.stringify(records, null, 2)}
+${JSON.stringify(records)}
 
 Record IDs that MUST be evaluated: ${recordIds.length > 0 ? JSON.stringify(recordIds) : 'No records found'}
 
@@ -1912,7 +1892,9 @@ After evaluating each record, determine overall status based on the record evalu
           }));
           
           console.log('✅ Final recordEvaluations:', normalizedEvaluations.length, 'entries');
-          console.log('✅ Final recordEvaluations:', JSON.stringify(normalizedEvaluations, null, 2));
+          if (DEBUG_ODOO) {
+            console.log('✅ Final recordEvaluations:', JSON.stringify(normalizedEvaluations, null, 2));
+          }
           
           return {
             success: true,